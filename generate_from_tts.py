@@ -9,18 +9,95 @@ into JSON endpoints (same sites handled by the TTS Lua importer) and then
 extract card image URLs and quantities to build the printable PDF.
 """
 
-import json
-import requests
+import argparse
+import functools
+import hashlib
+import logging
+import os
+import re
+import time
 from pathlib import Path
-from printerGA import GADeckPrinter
-from typing import Optional, Tuple
+from printerGA import GADeckPrinter, CARDS_STREAM_THRESHOLD_BYTES, ijson, load_json_file, http_get, close_session
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlparse
 
 
 # Create output directory
 output_dir = Path("./output")
 output_dir.mkdir(exist_ok=True)
 
+# Fetched deck JSON is kept here so repeat runs on the same URL skip the network
+URL_CACHE_DIR = output_dir / ".urlcache"
+URL_CACHE_TTL = 3600  # seconds
 
+
+def _has_object_states(path: Path) -> bool:
+    """Check for a top-level ObjectStates key by streaming the file.
+
+    Stops at the first top-level key that identifies the file: ObjectStates
+    for a TTS save, or deck_name/cards for a saved deck.json.
+    """
+    with path.open("rb") as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix == "" and event == "map_key":
+                if value == "ObjectStates":
+                    return True
+                if value in ("deck_name", "cards"):
+                    return False
+    return False
+
+
+# fractalofin.site page patterns: (regex, first group is the player id, filename suffix)
+_FRACTAL_PATTERNS = [
+    (re.compile(r"/player/(\d+).html#deck_(\d+)"), True, ""),
+    (re.compile(r"#deck_(\d+)_(\d+)"), False, ""),
+    (re.compile(r"/\w+/(\d+).html#deck_(\d+)_topcut"), False, "_topcut"),
+    (re.compile(r"/\w+/(\d+).html#deck_(\d+)"), False, ""),
+]
+
+
+def _silvie_org_url(u: str) -> str:
+    if "format=json" not in u:
+        u += ("?format=json" if "?" not in u else "&format=json")
+    return u
+
+
+def _silvie_gg_url(u: str) -> str:
+    u = u.replace("silvie.gg/decklist?deck=", "silvie.gg/api/tts/export")
+    return u.replace("silvie.gg/decklist/", "silvie.gg/api/tts/export")
+
+
+def _tcgarchitect_url(u: str) -> str:
+    u = u.replace("tcgarchitect.com/grand-archive/decks/", "api.tcgarchitect.com/tts/grand-archive/deck/")
+    return u.replace("tcgarchitect.com/grand-archive/tournaments/decklists/", "api.tcgarchitect.com/tts/grand-archive/tournament-deck/")
+
+
+def _fractalofin_url(u: str) -> str:
+    # Try to match expected patterns and build a JSON URL; keep best-effort approach
+    for pat, swap, suffix in _FRACTAL_PATTERNS:
+        m = pat.search(u)
+        if m:
+            a, b = m.groups()
+            player_id = int(a) if swap else int(b)
+            event_id = int(b) if swap else int(a)
+            return f"https://fractalofin.site/tts/event_{event_id}/{player_id}{suffix}.json"
+    return u
+
+
+# Known decklist hosts mapped to the rewrite producing their JSON endpoint
+_HOST_TRANSFORMS: Dict[str, Callable[[str], str]] = {
+    "dungeongui.de": lambda u: u.replace("/deck/", "/json/"),
+    "silvie.org": _silvie_org_url,
+    "silv.ie": _silvie_org_url,
+    "shoutatyourdecks.com": lambda u: u.replace("/decks/", "/api/"),
+    "silvie.gg": _silvie_gg_url,
+    "jsonblob.com": lambda u: u.replace("jsonblob.com/", "jsonblob.com/api/jsonBlob/"),
+    "tcgarchitect.com": _tcgarchitect_url,
+    "fractalofin.site": _fractalofin_url,
+}
+
+
+@functools.lru_cache(maxsize=256)
 def transform_deck_url(deck_url: str) -> str:
     """Apply known-site transformations to get a JSON endpoint (mimics Lua logic)."""
     u = deck_url
@@ -28,62 +105,134 @@ def transform_deck_url(deck_url: str) -> str:
     if not u.startswith("http"):
         u = "https://" + u
 
-    if "dungeongui.de" in u:
-        u = u.replace("/deck/", "/json/")
-    elif "silvie.org" in u or "silv.ie" in u:
-        if "format=json" not in u:
-            u += ("?format=json" if "?" not in u else "&format=json")
-    elif "shoutatyourdecks.com" in u:
-        u = u.replace("/decks/", "/api/")
-    elif "silvie.gg" in u:
-        u = u.replace("silvie.gg/decklist?deck=", "silvie.gg/api/tts/export")
-        u = u.replace("silvie.gg/decklist/", "silvie.gg/api/tts/export")
-    elif "jsonblob.com" in u:
-        u = u.replace("jsonblob.com/", "jsonblob.com/api/jsonBlob/")
-    elif "tcgarchitect.com" in u:
-        u = u.replace("tcgarchitect.com/grand-archive/decks/", "api.tcgarchitect.com/tts/grand-archive/deck/")
-        u = u.replace("tcgarchitect.com/grand-archive/tournaments/decklists/", "api.tcgarchitect.com/tts/grand-archive/tournament-deck/")
-    elif "fractalofin.site" in u:
-        # Try to match expected patterns and build a JSON URL; keep best-effort approach
-        import re
-        patterns = [
-            (r"/player/(\d+).html#deck_(\d+)", True, ""),
-            (r"#deck_(\d+)_(\d+)", False, ""),
-            (r"/\w+/(\d+).html#deck_(\d+)_topcut", False, "_topcut"),
-            (r"/\w+/(\d+).html#deck_(\d+)", False, ""),
-        ]
-        m_event = None
-        for pat, swap, suffix in patterns:
-            m = re.search(pat, u)
-            if m:
-                a, b = m.groups()
-                player_id = int(a) if swap else int(b)
-                event_id = int(b) if swap else int(a)
-                u = f"https://fractalofin.site/tts/event_{event_id}/{player_id}{suffix}.json"
-                break
-    return u
+    # exact host first, then subdomains such as www.
+    host = urlparse(u).hostname or ""
+    fn = _HOST_TRANSFORMS.get(host) or next(
+        (f for k, f in _HOST_TRANSFORMS.items() if host.endswith("." + k)), None
+    )
+    return fn(u) if fn else u
+
+
+def _read_json_file(path: Path):
+    """Parse a downloaded JSON file (memory-mapped for orjson when it is large)."""
+    return load_json_file(path)
+
+
+def _cached_download(url: str, ttl: float = URL_CACHE_TTL) -> Path:
+    """Return a local copy of the body of ``url``, fetching it if the cached one is missing or stale.
+
+    A ``ttl`` of 0 always fetches.
+    """
+    path = URL_CACHE_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+    if path.exists():
+        age = time.time() - path.stat().st_mtime
+        if age < ttl:
+            print(f"Using copy cached {int(age // 60)} min ago (use refresh to re-download)")
+            return path
+
+    URL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    try:
+        # stream to disk so large bodies are never held in memory whole
+        with http_get(url, headers={"Accept": "application/json"}, timeout=(5, 30), stream=True) as resp:
+            resp.raise_for_status()
+            with tmp.open("wb") as f:
+                for chunk in resp.iter_content(chunk_size=64 * 1024):
+                    f.write(chunk)
+    except BaseException:
+        # do not leave a partial body behind
+        tmp.unlink(missing_ok=True)
+        raise
+    os.replace(tmp, path)
+    return path
+
+
+def _cached_fetch(url: str, ttl: float = URL_CACHE_TTL):
+    """Fetch and parse JSON from ``url`` through the on-disk URL cache."""
+    path = _cached_download(url, ttl)
+    try:
+        return _read_json_file(path)
+    except Exception:
+        # do not keep serving a response that is not JSON
+        path.unlink(missing_ok=True)
+        raise
 
 
 def fetch_json_from_url(url: str):
     try:
-        r = requests.get(url, timeout=15)
-        r.raise_for_status()
-        return r.json()
+        return _cached_fetch(url)
     except Exception:
         # Not JSON or failed; return None
         return None
 
 
+_PREFERRED_DECKS = ("main", "material", "sideboard")
+
+
+def _iter_entries(cards_root):
+    """Yield (source_deck, entry) pairs from a deck export.
+
+    A mapping of decks (main, material, sideboard, ...) is walked in preferred
+    order followed by any other decks; a plain list is a single deck.
+    """
+    if not isinstance(cards_root, dict):
+        if isinstance(cards_root, list):
+            for e in cards_root:
+                yield None, e
+        return
+
+    order = [*_PREFERRED_DECKS, *(k for k in cards_root if k not in _PREFERRED_DECKS)]
+    for deck in order:
+        value = cards_root.get(deck)
+        if not value:
+            continue
+        if isinstance(value, list):
+            for e in value:
+                yield deck, e
+        elif isinstance(value, dict):
+            for key, e in value.items():
+                if isinstance(e, dict):
+                    e.setdefault("name", key)
+                yield deck, e
+
+
+# Fallback key orders for the card name and image URL across site exports
+_NAME_KEYS = ("name", "title", "card_name")
+_IMG_KEYS = ("image", "image_url", "img", "FaceURL", "face")
+
+
+def _first(d: dict, keys: tuple, default=""):
+    """Return the first truthy value of ``keys`` in ``d``, else ``default``."""
+    for k in keys:
+        v = d.get(k)
+        if v:
+            return v
+    return default
+
+
+def _card_row(deck, e: dict) -> tuple:
+    """Extract a (name, type, quantity, image_url) row from a deck entry."""
+    name = _first(e, _NAME_KEYS, "Unknown")
+    qty = int(e.get("quantity", e.get("qty", 1) or 1))
+    img = _first(e, _IMG_KEYS)
+    # Optionally annotate name with source deck for clarity
+    srcdeck = e.get("_source_deck", deck)
+    if srcdeck and srcdeck not in ("main",):
+        # keep main names as-is, but prefix others (material/sideboard)
+        name = f"[{srcdeck}] {name}"
+    return name, e.get("type", "Card"), qty, img
+
+
 def build_printer_from_deck_json(data: dict, preferred_deck: str = None) -> GADeckPrinter:
     """Convert a variety of deck JSON shapes into a GADeckPrinter instance."""
     printer = GADeckPrinter()
 
     # If the JSON is already in printer format
-    if isinstance(data, dict) and data.get("cards") and isinstance(data.get("cards"), list):
-        # assume data is { deck_name, cards: [...] }
+    cards = data.get("cards") if isinstance(data, dict) else None
+    if cards and isinstance(cards, list):
+        # assume data is { deck_name, cards: [...] }; records are taken as-is
         printer.deck_name = data.get("deck_name", printer.deck_name)
-        for c in data.get("cards", []):
-            printer.add_card(name=c.get("name", "Unknown"), card_type=c.get("type", "Card"), quantity=c.get("quantity", 1), image_url=c.get("image_url", ""))
+        printer.add_cards_bulk(cards)
         return printer
 
     # If data has a 'cards' mapping (site exports)
@@ -95,77 +244,19 @@ def build_printer_from_deck_json(data: dict, preferred_deck: str = None) -> GADe
         # Try to treat root as a single deck (list or dict)
         cards_root = data
 
-    # If cards_root is a mapping of decks (main, material, sideboard, ...),
-    # aggregate selected decks into the printer so the PDF contains all cards.
-    entries = []
-    if isinstance(cards_root, dict):
-        # preferred order: main, material, sideboard, then any other decks
-        preferred_keys = ["main", "material", "sideboard"]
-        seen = set()
-        for k in preferred_keys:
-            if k in cards_root and cards_root[k]:
-                value = cards_root[k]
-                if isinstance(value, list):
-                    for info in value:
-                        if isinstance(info, dict):
-                            info.setdefault("_source_deck", k)
-                        entries.append(info)
-                elif isinstance(value, dict):
-                    for key, info in value.items():
-                        if isinstance(info, dict):
-                            info.setdefault("name", key)
-                            info.setdefault("_source_deck", k)
-                        entries.append(info)
-                seen.add(k)
-
-        # include any other decks not in preferred_keys
-        for k, value in cards_root.items():
-            if k in seen:
-                continue
-            if not value:
-                continue
-            if isinstance(value, list):
-                for info in value:
-                    if isinstance(info, dict):
-                        info.setdefault("_source_deck", k)
-                    entries.append(info)
-            elif isinstance(value, dict):
-                for key, info in value.items():
-                    if isinstance(info, dict):
-                        info.setdefault("name", key)
-                        info.setdefault("_source_deck", k)
-                    entries.append(info)
-
-    else:
-        # not a mapping: treat as single deck
-        if isinstance(cards_root, list):
-            entries = cards_root
-        elif isinstance(cards_root, dict):
-            for key, info in cards_root.items():
-                if isinstance(info, dict):
-                    info.setdefault("name", key)
-                entries.append(info)
-
     # Add entries to printer (merge all decks)
-    for e in entries:
-        if not isinstance(e, dict):
-            continue
-        name = e.get("name") or e.get("title") or e.get("card_name") or "Unknown"
-        qty = int(e.get("quantity", e.get("qty", 1) or 1))
-        img = e.get("image") or e.get("image_url") or e.get("img") or e.get("FaceURL") or e.get("face") or ""
-        # Optionally annotate name with source deck for clarity
-        srcdeck = e.get("_source_deck")
-        if srcdeck and srcdeck not in ("main",):
-            # keep main names as-is, but prefix others (material/sideboard)
-            name = f"[{srcdeck}] {name}"
-        printer.add_card(name=name, card_type=e.get("type", "Card"), quantity=qty, image_url=img)
+    printer.add_cards(_card_row(deck, e) for deck, e in _iter_entries(cards_root) if isinstance(e, dict))
 
     return printer
 
 
-def generate_from_source(source: str, output: Optional[str] = None) -> Tuple[Optional[GADeckPrinter], Optional[str]]:
+def generate_from_source(source: str, output: Optional[str] = None,
+                         refresh: bool = False) -> Tuple[Optional[GADeckPrinter], Optional[str]]:
     """Generate printable PDF from a local TTS JSON or a decklist URL.
 
+    With ``refresh`` a URL source is always re-downloaded instead of being
+    served from the on-disk URL cache.
+
     Returns tuple (printer, output_path) on success, or (None, None) on failure.
     """
     out = output or str(output_dir / "cards_printable.pdf")
@@ -177,12 +268,17 @@ def generate_from_source(source: str, output: Optional[str] = None) -> Tuple[Opt
     if p.exists():
         print(f"Loading local file: {source}")
         try:
-            txt = p.read_text(encoding="utf-8")
-            j = json.loads(txt)
-            if isinstance(j, dict) and j.get("ObjectStates"):
-                printer.load_from_tts(source)
+            if ijson is not None and p.stat().st_size >= CARDS_STREAM_THRESHOLD_BYTES:
+                # let the loaders stream the file themselves
+                j = None
+                is_tts = _has_object_states(p)
+            else:
+                j = load_json_file(p)
+                is_tts = isinstance(j, dict) and bool(j.get("ObjectStates"))
+            if is_tts:
+                printer.load_from_tts(source, data=j)
             else:
-                printer.load_from_json(source)
+                printer.load_from_json(source, data=j)
         except Exception as e:
             print(f"Failed to parse local JSON: {e}")
             return None, None
@@ -192,25 +288,27 @@ def generate_from_source(source: str, output: Optional[str] = None) -> Tuple[Opt
         url = transform_deck_url(source)
         print(f"Fetching deck JSON from: {url}")
         try:
-            resp = requests.get(url, timeout=15)
-            resp.raise_for_status()
+            path = _cached_download(url, ttl=0 if refresh else URL_CACHE_TTL)
         except Exception as e:
             print(f"Error fetching URL: {e}")
             return None, None
 
         try:
-            data = resp.json()
+            data = _read_json_file(path)
         except Exception:
+            # do not keep serving a response that is not JSON
+            path.unlink(missing_ok=True)
             print("Response was not JSON; aborting.")
             return None, None
 
         printer = build_printer_from_deck_json(data)
 
-    if not printer.cards or sum(c.get("quantity", 1) for c in printer.cards) == 0:
+    total = sum([c.get("quantity", 1) for c in printer.cards])
+    if not printer.cards or total == 0:
         print("No cards found to render.")
         return None, None
 
-    print(f"Loaded {len(printer.cards)} unique cards (total copies: {sum(c.get('quantity',1) for c in printer.cards)})")
+    print(f"Loaded {len(printer.cards)} unique cards (total copies: {total})")
     print("=" * 50)
 
     # Generate printable cards PDF
@@ -226,9 +324,11 @@ def generate_from_source(source: str, output: Optional[str] = None) -> Tuple[Opt
     except Exception:
         # non-fatal; do not crash PDF generation if saving the URL fails
         pass
-    # Also save a deck.json for reference
+    # Also save a deck.json for reference, unless that is what we just loaded
     try:
-        printer.save_to_json(str(output_dir / "deck.json"))
+        dest = (output_dir / "deck.json").resolve()
+        if not (p.exists() and p.resolve() == dest):
+            printer.save_to_json(str(dest))
     except Exception:
         pass
 
@@ -237,3 +337,25 @@ def generate_from_source(source: str, output: Optional[str] = None) -> Tuple[Opt
 
     return printer, out
 
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate printable card PDF from TTS save or decklist URL")
+    parser.add_argument("source", help="Path to TTS JSON file or decklist URL")
+    parser.add_argument("--output", "-o", help="Output PDF filename", default=None)
+    parser.add_argument("--refresh", action="store_true", help="Re-download deck JSON instead of using the cached copy")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Log every image download and page")
+    args = parser.parse_args()
+
+    # printerGA reports through logging; per-image and per-page lines are DEBUG
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO, format="%(message)s")
+
+    try:
+        printer, out = generate_from_source(args.source, args.output, refresh=args.refresh)
+    finally:
+        close_session()
+    if printer is None:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
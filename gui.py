@@ -3,22 +3,36 @@
 Features:
 - Text input for a URL or local file path to use as `source`.
 - Output file chooser (Windows Save As dialog) to pick PDF path.
-- Indeterminate progress bar while work runs on a background thread.
+- Indeterminate progress bar while work runs in a background process.
 - Opens the generated PDF (or its folder) when finished.
 """
-import threading
+import multiprocessing
 import os
+import queue
+import threading
 import traceback
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
 
 from generate_from_tts import generate_from_source
+from printerGA import close_session
 
 
 DEFAULT_OUT = str(Path("./output/cards_printable.pdf"))
 
 
+def _worker_entry(src, out, refresh, result_q):
+    """Child-process entry point: run generation and report (ok, path_or_traceback)."""
+    try:
+        printer, path = generate_from_source(src, out, refresh=refresh)
+        result_q.put((True, path))
+    except Exception:
+        result_q.put((False, traceback.format_exc()))
+    finally:
+        close_session()
+
+
 class App(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -50,13 +64,20 @@ class App(tk.Tk):
         self.status_var = tk.StringVar(value="Idle")
         ttk.Label(frm, textvariable=self.status_var).grid(row=5, column=0, columnspan=3, sticky="w")
 
+        self.refresh_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(frm, text="Re-download deck", variable=self.refresh_var).grid(row=6, column=0, sticky="w", pady=(10, 0))
+
         self.generate_btn = ttk.Button(frm, text="Generate", command=self.start_generation)
         self.generate_btn.grid(row=6, column=2, sticky="e", pady=(10, 0))
         self.open_btn = ttk.Button(frm, text="Open Output", command=self.open_output, state="disabled")
         self.open_btn.grid(row=6, column=3, sticky="e", pady=(10, 0))
 
         self._worker = None
+        self._result_q = None
         self._result = None
+        # set from the waiter thread (via after) once the worker has finished
+        self._done_var = tk.BooleanVar(value=False)
+        self._done_var.trace_add("write", self._on_done)
 
     def browse_source(self):
         # allow selecting a local file or paste a URL
@@ -90,24 +111,34 @@ class App(tk.Tk):
         self.status_var.set("Starting generation...")
         self.progress.start(10)
 
-        # run in background
-        self._worker = threading.Thread(target=self._run_generation, args=(src, out), daemon=True)
+        # run in a separate process so image decoding and PDF encoding
+        # do not compete with the Tk event loop for the GIL
+        self._result = None
+        self._result_q = multiprocessing.Queue()
+        self._worker = multiprocessing.Process(target=_worker_entry, args=(src, out, self.refresh_var.get(), self._result_q), daemon=True)
         self._worker.start()
-        self.after(200, self._poll_worker)
-
-    def _run_generation(self, src, out):
-        try:
-            printer, path = generate_from_source(src, out)
-            self._result = (True, path)
-        except Exception:
-            tb = traceback.format_exc()
-            self._result = (False, tb)
-
-    def _poll_worker(self):
-        if self._worker and self._worker.is_alive():
-            # still running
-            self.after(200, self._poll_worker)
+        threading.Thread(target=self._wait_for_worker, daemon=True).start()
+
+    def _wait_for_worker(self):
+        """Block off the Tk thread until the worker reports, then wake the UI once."""
+        while True:
+            try:
+                self._result = self._result_q.get(timeout=1)
+                break
+            except queue.Empty:
+                if not self._worker.is_alive():
+                    # exited without reporting, or reported just before exiting
+                    try:
+                        self._result = self._result_q.get_nowait()
+                    except queue.Empty:
+                        pass
+                    break
+        self.after(0, self._done_var.set, True)
+
+    def _on_done(self, *_):
+        if not self._done_var.get():
             return
+        self._done_var.set(False)
 
         # finished
         self.progress.stop()
@@ -146,4 +177,6 @@ def run():
 
 
 if __name__ == "__main__":
+    # required for multiprocessing in the frozen (PyInstaller) executable
+    multiprocessing.freeze_support()
     run()
@@ -11,19 +11,206 @@ from reportlab.lib import colors
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
+from reportlab.lib.utils import ImageReader
+import asyncio
+import base64
+import functools
 import json
+import hashlib
+import importlib.util
+import logging
+import mmap
+import textwrap
 from pathlib import Path
 from io import BytesIO
 import requests
-from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlparse, unquote_to_bytes
+from urllib.request import url2pathname
 import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, repeat
 from PIL import Image as PILImage
 
+try:
+    import orjson
+except ImportError:  # optional; fall back to the stdlib parser
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional; large files are then parsed in one go
+    ijson = None
+
+try:
+    import httpx
+except ImportError:  # optional; images are then fetched by the thread pool alone
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+# Files at least this large are stream-parsed with ijson when it is installed
+STREAM_THRESHOLD_BYTES = 10 * 1024 * 1024
+
+# Deck JSON (save_to_json's format) at least this large is read card by card
+# with ijson; below it the whole-document parse is faster
+CARDS_STREAM_THRESHOLD_BYTES = 1024 * 1024
+
+# Card images are immutable once published, so downloads are kept across runs
+DEFAULT_IMAGE_CACHE_DIR = Path.home() / ".cache" / "ga_proxier"
+
+# Page margin around the card grid on printable pages
+PAGE_MARGIN = 0.5 * inch
+
+# Card images larger than this resolution at their printed size are downscaled
+PRINT_DPI = 300
+
+# Field defaults for a card record, matching add_card's keyword defaults
+_CARD_DEFAULTS = {
+    "name": "Unknown",
+    "type": "Card",
+    "cost": 0,
+    "power": 0,
+    "toughness": 0,
+    "ability": "",
+    "quantity": 1,
+    "image_url": ""
+}
+
+
+def _loads(data):
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_json_file(path):
+    """
+    Parse a JSON file straight from its bytes
+    
+    Files of STREAM_THRESHOLD_BYTES or more are memory-mapped and handed to
+    orjson directly, so the raw text never needs its own heap copy.
+    """
+    with open(path, 'rb') as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size >= STREAM_THRESHOLD_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        return _loads(f.read())
+
+
+def _wrap_text(text, char_limit):
+    """Wrap text to specified character limit"""
+    # Collapse whitespace runs first, as splitting on words used to
+    return textwrap.wrap(" ".join(text.split()), width=char_limit,
+                         break_long_words=False, break_on_hyphens=False)
+
+
+def _read_local_image(url):
+    """Read image bytes for a data: URI, a file:// URL or a plain file path"""
+    parsed = urlparse(url)
+    if parsed.scheme == "data":
+        header, _, payload = url.partition(",")
+        if header.endswith(";base64"):
+            return base64.b64decode(payload)
+        return unquote_to_bytes(payload)
+    if parsed.scheme == "file":
+        return Path(url2pathname(parsed.path)).read_bytes()
+    if len(parsed.scheme) <= 1:
+        # no scheme, or a Windows drive letter such as C:/
+        return Path(url).read_bytes()
+    raise ValueError(f"Unsupported image URL scheme: {parsed.scheme}")
+
+
+def image_cache_path(cache_dir, url):
+    """Path of the cached download for ``url`` inside ``cache_dir``"""
+    return Path(cache_dir) / hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+
+# Shared by every printer and by generate_from_tts's deck JSON fetches, so
+# all requests to a host reuse its pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "GrandArchiveProxier"})
+_adapter = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+)
+_SESSION.mount("http://", _adapter)
+_SESSION.mount("https://", _adapter)
+
+
+def _event_loop_running():
+    """Whether the calling thread is inside a running asyncio event loop"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def http_get(url, **kwargs):
+    """GET ``url`` through the shared session; keyword arguments go to requests"""
+    return _SESSION.get(url, **kwargs)
+
+
+def close_session():
+    """Release the shared session's pooled connections (reopened on the next request)"""
+    _SESSION.close()
+
+
+@functools.lru_cache(maxsize=256)
+def _fetch_bytes(url, cache_dir=None, timeout=10):
+    """
+    Original image file bytes for an http(s) URL
+    
+    Kept in memory for the life of the process, so printers created for
+    later decks share earlier downloads; misses fall back to the on-disk
+    cache in ``cache_dir`` and then to the network. Failures raise and
+    are therefore not cached.
+    """
+    if cache_dir is not None:
+        cached = image_cache_path(cache_dir, url)
+        if cached.exists():
+            return cached.read_bytes()
+    
+    # Stream the body straight into one buffer rather than letting
+    # requests build response.content alongside it; the with block
+    # returns the connection to the pool even if reading fails
+    buf = BytesIO()
+    with _SESSION.get(url, timeout=timeout, stream=True) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        shutil.copyfileobj(response.raw, buf)
+    raw = buf.getvalue()
+    del buf
+    
+    _store_download(cache_dir, url, raw)
+    return raw
+
+
+def _store_download(cache_dir, url, raw):
+    """Check that downloaded bytes are an image and keep them in ``cache_dir``"""
+    PILImage.open(BytesIO(raw)).verify()
+    
+    if cache_dir is not None:
+        # Write-then-rename so no reader sees a partial file
+        cached = image_cache_path(cache_dir, url)
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cached.with_suffix(".tmp")
+        tmp.write_bytes(raw)
+        os.replace(tmp, cached)
+    
+    logger.debug("  Downloaded: %.60s...", url)
+
 
 class GADeckPrinter:
     """Generate PDF files for Grand Archive deck printing"""
     
-    def __init__(self, deck_name="GA_Deck", cards_per_row=3, cards_per_column=3):
+    def __init__(self, deck_name="GA_Deck", cards_per_row=3, cards_per_column=3,
+                 image_cache_dir=DEFAULT_IMAGE_CACHE_DIR, color_mode="rgb"):
         """
         Initialize the deck printer
         
@@ -31,13 +218,21 @@ class GADeckPrinter:
             deck_name: Name of the deck for the PDF title
             cards_per_row: Number of cards per row
             cards_per_column: Number of cards per column
+            image_cache_dir: Directory for the on-disk image cache, or None to disable it
+            color_mode: "rgb", or "grey" to embed greyscale images for monochrome printers
         """
+        if color_mode not in ("rgb", "grey"):
+            raise ValueError(f"color_mode must be 'rgb' or 'grey', not {color_mode!r}")
         self.deck_name = deck_name
         self.cards_per_row = cards_per_row
         self.cards_per_column = cards_per_column
+        self.color_mode = color_mode
         self.cards = []
+        self._card_index = {}  # Card record by name, for quantity updates
         self.card_images = {}  # Store card images
-        self.image_cache = {}  # Cache downloaded images
+        self.image_cache = {}  # Prepared image bytes, as embedded in this deck's PDF
+        self._readers = {}  # ImageReader per image URL, reused for every copy
+        self.image_cache_dir = image_cache_dir  # Downloaded images, keyed by URL hash
         
     def add_card(self, name, card_type, cost=0, power=0, toughness=0, ability="", quantity=1, image_url=""):
         """
@@ -64,32 +259,94 @@ class GADeckPrinter:
             "image_url": image_url
         }
         self.cards.append(card)
+        self._card_index[name] = card
         if image_url:
             self.card_images[name] = image_url
     
-    def load_from_json(self, json_file):
-        """Load deck from JSON file"""
-        with open(json_file, 'r') as f:
-            data = json.load(f)
+    def add_cards(self, cards):
+        """
+        Add several cards at once, extending the deck in a single step
+        
+        Args:
+            cards: Iterable of (name, card_type, quantity, image_url) tuples
+        """
+        new_cards = [
+            {
+                "name": name,
+                "type": card_type,
+                "cost": 0,
+                "power": 0,
+                "toughness": 0,
+                "ability": "",
+                "quantity": quantity,
+                "image_url": image_url
+            }
+            for name, card_type, quantity, image_url in cards
+        ]
+        self.cards.extend(new_cards)
+        self._card_index.update((card["name"], card) for card in new_cards)
+        self.card_images.update((card["name"], card["image_url"]) for card in new_cards if card["image_url"])
+    
+    def add_cards_bulk(self, cards):
+        """
+        Add card records that already use the deck's own field names
+        
+        Args:
+            cards: Iterable of card dicts as produced by save_to_json; missing
+                fields take the same defaults as add_card
+        """
+        new_cards = [{**_CARD_DEFAULTS, **card} for card in cards]
+        self.cards.extend(new_cards)
+        self._card_index.update((card["name"], card) for card in new_cards)
+        self.card_images.update((card["name"], card["image_url"]) for card in new_cards if card["image_url"])
+    
+    def load_from_json(self, json_file, data=None):
+        """Load deck from JSON file, or from already-parsed ``data`` if given"""
+        if data is None and ijson is not None and os.path.getsize(json_file) >= CARDS_STREAM_THRESHOLD_BYTES:
+            # Stream the card records so the whole document is never held
+            # in memory, picking up deck_name from the same pass
+            found = {}
+            
+            def events(f):
+                for prefix, event, value in ijson.parse(f, use_float=True):
+                    if prefix == "deck_name" and event == "string":
+                        found["deck_name"] = value
+                    yield prefix, event, value
+            
+            with open(json_file, 'rb') as f:
+                self.add_cards_bulk(ijson.items(events(f), "cards.item"))
+            self.deck_name = found.get("deck_name", self.deck_name)
+            return
+        
+        if data is None:
+            data = load_json_file(json_file)
         
         self.deck_name = data.get("deck_name", self.deck_name)
-        for card in data.get("cards", []):
-            self.add_card(**card)
+        self.add_cards_bulk(data.get("cards", []))
     
-    def load_from_tts(self, tts_json_file):
+    def load_from_tts(self, tts_json_file, data=None):
         """
         Load deck from Tabletop Simulator JSON save file
         
         Args:
             tts_json_file: Path to TTS save file
+            data: Already-parsed save contents; skips reading the file
         """
-        with open(tts_json_file, 'r') as f:
-            tts_data = json.load(f)
+        if data is not None:
+            object_states = data.get("ObjectStates", [])
+        elif ijson is not None and os.path.getsize(tts_json_file) >= STREAM_THRESHOLD_BYTES:
+            # Only the first object state is used, so stream it out of the
+            # save instead of materializing every object in memory
+            with open(tts_json_file, 'rb') as f:
+                first = next(ijson.items(f, "ObjectStates.item", use_float=True), None)
+            object_states = [first] if first else []
+        else:
+            tts_data = load_json_file(tts_json_file)
+            object_states = tts_data.get("ObjectStates", [])
         
         # Get the main deck object
-        object_states = tts_data.get("ObjectStates", [])
         if not object_states:
-            print("No ObjectStates found in TTS file")
+            logger.warning("No ObjectStates found in TTS file")
             return
         
         deck_obj = object_states[0]
@@ -106,7 +363,6 @@ class GADeckPrinter:
         
         # Process contained objects (individual cards)
         contained_objects = deck_obj.get("ContainedObjects", [])
-        card_count = {}
         
         for card_obj in contained_objects:
             card_name = card_obj.get("Nickname", "Unknown Card")
@@ -118,8 +374,8 @@ class GADeckPrinter:
             image_url = card_images_map.get(deck_id_key, "")
             
             # Count duplicates
-            if card_name not in card_count:
-                card_count[card_name] = 0
+            existing = self._card_index.get(card_name)
+            if existing is None:
                 self.add_card(
                     name=card_name,
                     card_type="Card",
@@ -128,21 +384,8 @@ class GADeckPrinter:
                     quantity=1
                 )
             else:
-                card_count[card_name] += 1
                 # Update quantity for existing card
-                for card in self.cards:
-                    if card["name"] == card_name:
-                        card["quantity"] += 1
-                        break
-    
-    def load_from_json(self, json_file):
-        """Load deck from JSON file"""
-        with open(json_file, 'r') as f:
-            data = json.load(f)
-        
-        self.deck_name = data.get("deck_name", self.deck_name)
-        for card in data.get("cards", []):
-            self.add_card(**card)
+                existing["quantity"] += 1
     
     def save_to_json(self, json_file):
         """Save deck to JSON file"""
@@ -150,52 +393,39 @@ class GADeckPrinter:
             "deck_name": self.deck_name,
             "cards": self.cards
         }
-        with open(json_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            Path(json_file).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(json_file, 'w') as f:
+                json.dump(data, f, indent=2)
     
     def create_card_box(self, c, x, y, width, height, card):
         """Draw a single card image on the canvas (images only, no text)"""
         # Try to download and draw image
         if card.get("image_url"):
             try:
-                img = self._download_image(card["image_url"])
-                if img:
+                reader = self._image_reader(card["image_url"])
+                if reader:
                     # Use full card dimensions (fill entire box)
-                    img_width = width
-                    img_height = height
-                    
-                    # Save image temporarily and draw
-                    temp_img_path = f"/tmp/card_{id(card)}.png"
-                    os.makedirs("/tmp", exist_ok=True)
-                    img.save(temp_img_path)
-                    c.drawImage(temp_img_path, x, y, width=img_width, height=img_height)
-                    
-                    # Clean up
-                    try:
-                        os.remove(temp_img_path)
-                    except:
-                        pass
+                    c.drawImage(reader, x, y, width=width, height=height)
             except Exception as e:
-                print(f"  Could not embed image: {e}")
+                logger.warning("  Could not embed image: %s", e)
     
-    def _wrap_text(self, text, char_limit):
-        """Wrap text to specified character limit"""
-        words = text.split()
-        lines = []
-        current_line = ""
-        
-        for word in words:
-            if len(current_line) + len(word) + 1 <= char_limit:
-                current_line += word + " "
-            else:
-                if current_line:
-                    lines.append(current_line.strip())
-                current_line = word + " "
-        
-        if current_line:
-            lines.append(current_line.strip())
+    def _image_reader(self, url):
+        """
+        Get a ReportLab ImageReader for an image URL
         
-        return lines
+        The reader wraps the downloaded file bytes directly, so JPEGs are
+        embedded as-is and nothing is re-encoded or written to disk.
+        """
+        reader = self._readers.get(url)
+        if reader is None:
+            data = self._download_image(url)
+            if data is None:
+                return None
+            reader = ImageReader(BytesIO(data))
+            self._readers[url] = reader
+        return reader
     
     def _download_image(self, url, timeout=10):
         """
@@ -206,25 +436,102 @@ class GADeckPrinter:
             timeout: Request timeout in seconds
             
         Returns:
-            PIL Image object or None if download fails
+            Image file bytes or None if download fails
         """
         try:
             # Check cache first
             if url in self.image_cache:
                 return self.image_cache[url]
             
-            response = requests.get(url, timeout=timeout)
-            response.raise_for_status()
+            # Local files and data: URIs skip requests and the disk cache
+            if urlparse(url).scheme not in ("http", "https"):
+                data = self._prepare_image(_read_local_image(url))
+                self.image_cache[url] = data
+                return data
             
-            # Convert to PIL Image
-            img = PILImage.open(BytesIO(response.content))
-            self.image_cache[url] = img
-            print(f"  Downloaded: {url[:60]}...")
-            return img
+            # Then the process-wide cache, the disk cache and the network
+            cache_dir = None if self.image_cache_dir is None else str(self.image_cache_dir)
+            data = self._prepare_image(_fetch_bytes(url, cache_dir, timeout))
+            self.image_cache[url] = data
+            return data
         except Exception as e:
-            print(f"  Warning: Could not download image from {url}: {e}")
+            logger.warning("  Warning: Could not download image from %s: %s", url, e)
             return None
     
+    async def _download_all(self, urls, timeout=10):
+        """
+        Fetch image URLs concurrently over one httpx client into the disk cache
+        
+        With the h2 package installed the requests to each host are
+        multiplexed over a single HTTP/2 connection. Failures are only
+        logged at debug level: _download_image retries them afterwards.
+        """
+        async def fetch(client, url):
+            try:
+                response = await client.get(url)
+                response.raise_for_status()
+                # PIL's check and the disk write would otherwise stall the loop
+                await asyncio.to_thread(_store_download, self.image_cache_dir, url, response.content)
+            except Exception as e:
+                logger.debug("  Deferred %.60s...: %s", url, e)
+        
+        limits = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+        async with httpx.AsyncClient(
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=limits,
+            timeout=timeout,
+            follow_redirects=True,
+            headers={"User-Agent": "GrandArchiveProxier"}
+        ) as client:
+            await asyncio.gather(*(fetch(client, url) for url in urls))
+    
+    def _card_size(self):
+        """Width and height in points of one card slot on a printable page"""
+        page_width, page_height = letter
+        return ((page_width - 2 * PAGE_MARGIN) / self.cards_per_row,
+                (page_height - 2 * PAGE_MARGIN) / self.cards_per_column)
+    
+    def _prepare_image(self, data):
+        """
+        Shrink image bytes to PRINT_DPI at the printed card size, and convert
+        them to greyscale when color_mode is "grey"
+        
+        Colour images within 1.2x of that resolution are returned untouched
+        so they are embedded without re-encoding.
+        
+        Args:
+            data: Original image file bytes
+            
+        Returns:
+            Image file bytes to embed
+        """
+        card_width, card_height = self._card_size()
+        target = (int(card_width / inch * PRINT_DPI), int(card_height / inch * PRINT_DPI))
+        img = PILImage.open(BytesIO(data))
+        oversized = img.width > target[0] * 1.2 or img.height > target[1] * 1.2
+        grey = self.color_mode == "grey"
+        if not oversized and (not grey or img.mode == "L"):
+            # Nothing to change: embed the original bytes without decoding
+            return data
+        
+        if img.format == "JPEG":
+            # Let the JPEG decoder do the coarse downscale (DCT scaling) and
+            # the greyscale conversion, so the full-size image is never decoded
+            img.draft("L" if grey and img.mode == "RGB" else img.mode,
+                      target if oversized else img.size)
+        if oversized:
+            img.thumbnail(target, PILImage.LANCZOS)
+        has_alpha = img.mode in ("RGBA", "LA") or "transparency" in img.info
+        if grey:
+            # One channel instead of three: a third of the pixel data to compress
+            img = img.convert("LA" if has_alpha else "L")
+        buf = BytesIO()
+        if has_alpha:
+            img.save(buf, "PNG")
+        else:
+            img.convert("L" if grey else "RGB").save(buf, "JPEG", quality=85)
+        return buf.getvalue()
+    
     def create_deck_list_pdf(self, output_file):
         """Create a PDF with a deck list table"""
         doc = SimpleDocTemplate(output_file, pagesize=letter)
@@ -255,16 +562,18 @@ class GADeckPrinter:
         
         # Create table data
         table_data = [["Card Name", "Type", "Cost", "Power", "Toughness", "Quantity", "Image URL"]]
-        for card in self.cards:
-            table_data.append([
+        table_data += [
+            [
                 card["name"],
                 card["type"],
                 str(card["cost"]),
                 str(card["power"]),
                 str(card["toughness"]),
                 str(card["quantity"]),
-                card.get("image_url", "")[:50] + "..." if card.get("image_url", "") else ""
-            ])
+                url[:50] + "..." if (url := card.get("image_url", "")) else ""
+            ]
+            for card in self.cards
+        ]
         
         # Create table
         table = Table(table_data, colWidths=[1.5*inch, 1*inch, 0.6*inch, 0.6*inch, 0.8*inch, 0.6*inch, 1.2*inch])
@@ -284,40 +593,75 @@ class GADeckPrinter:
         
         story.append(table)
         doc.build(story)
-        print(f"✓ Deck list PDF created: {output_file}")
+        logger.info("✓ Deck list PDF created: %s", output_file)
     
     def create_printable_cards_pdf(self, output_file):
         """Create a PDF with card layouts for printing"""
         page_width, page_height = letter
-        margin = 0.5 * inch
-        card_width = (page_width - 2 * margin) / self.cards_per_row
-        card_height = (page_height - 2 * margin) / self.cards_per_column
+        margin = PAGE_MARGIN
+        card_width, card_height = self._card_size()
         
-        c = canvas.Canvas(output_file, pagesize=letter)
+        # Page content streams are compressed (ReportLab's default, made
+        # explicit); the canvas still holds the document until save()
+        c = canvas.Canvas(output_file, pagesize=letter, pageCompression=1)
         card_index = 0
         page_num = 1
         total_cards = sum(card["quantity"] for card in self.cards)
-        print(f"\nGenerating printable PDF with {total_cards} cards...")
-        
-        for card in self.cards:
-            for qty in range(card["quantity"]):
-                if card_index >= self.cards_per_row * self.cards_per_column:
-                    c.showPage()
-                    card_index = 0
-                    page_num += 1
-                    print(f"  Page {page_num}...")
-                
-                row = card_index // self.cards_per_row
-                col = card_index % self.cards_per_row
-                
-                x = margin + col * card_width
-                y = page_height - margin - (row + 1) * card_height
-                
-                self.create_card_box(c, x, y, card_width, card_height, card)
-                card_index += 1
+        logger.info("\nGenerating printable PDF with %d cards...", total_cards)
+        
+        # Download every unique image in parallel up front and build its
+        # ImageReader, so each copy of a card draws from the same reader
+        # (decoded once) and the render loop below never touches the network
+        urls = {card["image_url"] for card in self.cards if card.get("image_url")}
+        if httpx is not None and self.image_cache_dir is not None:
+            # Images not on disk yet are fetched in one async pass first, so
+            # the thread pool below mostly reads them back from the cache.
+            # asyncio.run cannot nest, so inside a running event loop
+            # (Jupyter, an async app) the thread pool fetches everything
+            missing = [
+                url for url in urls
+                if urlparse(url).scheme in ("http", "https")
+                and not image_cache_path(self.image_cache_dir, url).exists()
+            ]
+            if missing and not _event_loop_running():
+                asyncio.run(self._download_all(missing))
+        if urls:
+            with ThreadPoolExecutor(max_workers=min(16, len(urls))) as executor:
+                list(executor.map(self._image_reader, urls))
+        
+        # Slot positions on a page are the same every time; work them out once
+        cards_per_page = self.cards_per_row * self.cards_per_column
+        positions = [
+            (margin + (i % self.cards_per_row) * card_width,
+             page_height - margin - (i // self.cards_per_row + 1) * card_height)
+            for i in range(cards_per_page)
+        ]
+        
+        # One entry per printed copy
+        copies = list(chain.from_iterable(repeat(card, card["quantity"]) for card in self.cards))
+        
+        # Position of the last copy using each image, so its reader (and the
+        # decoded pixels it holds) can be dropped once that copy is drawn
+        last_use = {card.get("image_url"): n for n, card in enumerate(copies)}
+        
+        for n, card in enumerate(copies):
+            if card_index >= cards_per_page:
+                c.showPage()
+                card_index = 0
+                page_num += 1
+                logger.debug("  Page %d...", page_num)
+            
+            x, y = positions[card_index]
+            self.create_card_box(c, x, y, card_width, card_height, card)
+            card_index += 1
+            
+            if last_use.get(card.get("image_url")) == n:
+                self._readers.pop(card.get("image_url"), None)
         
         c.save()
-        print(f"✓ Printable cards PDF created: {output_file}")
+        # Anything left over (e.g. no cards drawn) is no longer needed
+        self._readers.clear()
+        logger.info("✓ Printable cards PDF created: %s", output_file)
 
 
 def example_deck():
@@ -337,6 +681,8 @@ def example_deck():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     # Create example deck
     printer = example_deck()
     
@@ -1,21 +1,9 @@
 """Command-line UI module for GrandArchiveProxier.
 
-Separates argument parsing and user interaction from the core logic
-in `generate_from_tts.py`.
+The argument parsing lives in `generate_from_tts.main` so the module can be
+run directly; this entry point is kept for existing `python ui.py` usage.
 """
-import argparse
-from generate_from_tts import generate_from_source
-
-
-def main():
-    parser = argparse.ArgumentParser(description="Generate printable card PDF from TTS save or decklist URL")
-    parser.add_argument("source", help="Path to TTS JSON file or decklist URL")
-    parser.add_argument("--output", "-o", help="Output PDF filename", default=None)
-    args = parser.parse_args()
-
-    printer, out = generate_from_source(args.source, args.output)
-    if printer is None:
-        raise SystemExit(1)
+from generate_from_tts import main
 
 
 if __name__ == "__main__":